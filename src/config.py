@@ -3,6 +3,8 @@ Configuration management module.
 Simple environment variable-based configuration.
 """
 import os
+from functools import cached_property
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -13,12 +15,10 @@ class Config:
     """
     Simple configuration from environment variables.
     All settings have sensible defaults.
+    Values are read once and cached; call invalidate() after changing
+    the environment.
     """
     
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        pass
-    
     @property
     def openai_api_key(self) -> str:
         """Get OpenAI API key."""
@@ -35,21 +35,50 @@ class Config:
         """Set OpenAI API key."""
         os.environ["OPENAI_API_KEY"] = value
     
-    @property
+    @cached_property
     def llm_model(self) -> str:
         """Get LLM model name."""
         return os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
-    @property
+    @cached_property
+    def toc_model(self) -> str:
+        """Get model name for table-of-contents formatting (defaults to the LLM model)."""
+        return os.getenv("TOC_MODEL") or self.llm_model
+    
+    @cached_property
     def temperature(self) -> float:
         """Get LLM temperature."""
         return float(os.getenv("TEMPERATURE", "0.3"))
     
-    @property
+    @cached_property
     def max_tokens(self) -> int:
         """Get max tokens for LLM response."""
         return int(os.getenv("MAX_TOKENS", "3000"))
     
+    @cached_property
+    def enable_summary_cache(self) -> bool:
+        """Whether to reuse tables of contents of unchanged documents."""
+        return os.getenv("ENABLE_SUMMARY_CACHE", "false").lower() in ("1", "true", "yes")
+    
+    @cached_property
+    def llm_cache_path(self) -> Optional[str]:
+        """Get SQLite database path for caching LLM responses (None disables it)."""
+        return os.getenv("LLM_CACHE_PATH") or None
+    
+    @cached_property
+    def batch_summaries(self) -> bool:
+        """Whether to summarize all PDFs of a run with one batched LLM call."""
+        return os.getenv("BATCH_SUMMARIES", "false").lower() in ("1", "true", "yes")
+    
+    @cached_property
+    def log_level(self) -> str:
+        """Get log level of the pipeline output (e.g. INFO, WARNING)."""
+        return os.getenv("LOG_LEVEL", "INFO").upper()
+    
+    def invalidate(self):
+        """Drop cached values so they are re-read from the environment."""
+        self.__dict__.clear()
+    
     def __repr__(self) -> str:
         """String representation of configuration."""
         return f"Config(model={self.llm_model}, temperature={self.temperature})"
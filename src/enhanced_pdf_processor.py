@@ -2,13 +2,140 @@
 Enhanced PDF processing module using PyMuPDF.
 Provides better text extraction with structural information.
 """
+import copy
+from dataclasses import dataclass
 import fitz  # PyMuPDF
+import mmap
+import numpy as np
+import os
 import re
-from pathlib import Path
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
 from langchain_core.documents import Document
 
-# No longer needed - we work directly with documents data
+try:
+    from numba import njit  # Optional: compiles the per-block font check
+except ImportError:
+    njit = None
+
+# Documents shorter than this many pages per worker are extracted in-process
+MIN_PAGES_PER_WORKER = 8
+
+# Upper bound on page ranges handed to each worker process
+SHARDS_PER_WORKER = 4
+
+# Blocks longer than this skip building font arrays before title detection
+# (the font-based check only accepts titles of up to 100 characters)
+FONT_CHECK_MAX_CHARS = 200
+
+# Span flag bit set by MuPDF for bold fonts
+BOLD_FLAG = fitz.TEXT_FONT_BOLD
+
+# Dict-extraction flags for font-size sweeps: image blocks (and their pixel
+# data) are not needed when only span sizes are read
+SIZE_SWEEP_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Dots and dashes, dropped before the page-number test ("12", "3-4"). The test
+# is str.isdigit(), which also accepts digits that \d does not ('²', '①')
+_PAGENUM_PUNCT = str.maketrans('', '', '.-')
+
+# Non-ASCII letters that case-fold onto ASCII ones (dotted/dotless I, long s,
+# Kelvin sign); rejected like ASCII letters by the first-character screen
+_FOLDED_LETTERS = frozenset('\u0130\u0131\u017f\u212a')
+
+# Common non-title patterns. Letter-initial text is screened out before they
+# run (see _classify_text), so they are matched case-sensitively
+_NON_TITLE_PATTERNS = [
+    r'^(example|proof|definition|proposition|theorem|lemma|corollary)\s*\d*',  # Mathematical terms
+    r'^(fig\.|figure|table|algorithm)\s+\d+',  # Figure/Table captions
+    r'^[a-z]',  # Starts with lowercase
+    r'^\d+$',  # Pure numbers
+    r'^[A-Za-z]\s*[=<>]',  # Mathematical expressions
+    r'^[A-Za-z]\s*[+\-*/]',  # Mathematical operations
+    r'^\w+\s*[=<>]\s*\w+',  # Equations
+    r'^[A-Za-z]\s*\(',  # Function calls
+    r'^\w+\s*:',  # Labels
+    r'^[A-Za-z]\s*[0-9]',  # Mixed alphanumeric without proper structure
+]
+
+# Numbered section headings, one alternative per numbering style
+_NUMBERED_SECTION_PATTERNS = [
+    r'^\d+\s+[A-Z]',  # "1 Introduction"
+    r'^\d+\.\s*[A-Z]',  # "1. Introduction" (with optional space after dot)
+    r'^\d+\.\d+\s*[A-Z]',  # "1.1 Methods" (with optional space)
+    r'^\d+\.\d+\.\s*[A-Z]',  # "1.1. Details" (with optional space after dot)
+    r'^\d+\.\d+\.\d+\s*[A-Z]',  # "1.1.1 Details" (with optional space)
+    r'^\d+\.\d+\.\d+\.\s*[A-Z]',  # "1.1.1. Specifics" (with optional space after dot)
+    r'^\d+\.\d+\.\d+\.\d+\s*[A-Z]',  # "1.1.1.1 Specifics" (with optional space)
+    r'^\d+\n[A-Z]',  # "1\nIntroduction" (with line break)
+    r'^\d+\.\n[A-Z]',  # "1.\nIntroduction" (with line break)
+    r'^\d+\.\d+\n[A-Z]',  # "1.1\nMethods" (with line break)
+    r'^\d+\.\d+\.\n[A-Z]',  # "1.1.\nMethods" (with line break)
+    r'^\d+\.\d+\.\d+\n[A-Z]',  # "1.1.1\nDetails" (with line break)
+]
+
+# Figure/Table/Algorithm captions
+_SPECIAL_HEADER_PATTERNS = [
+    r'^Figure\s+\d+',
+    r'^Table\s+\d+',
+    r'^Algorithm\s+\d+',
+]
+
+# Common section names, only when they appear alone (compared lowercased;
+# singular and plural forms are both listed)
+_SECTION_NAMES = frozenset({
+    'abstract',
+    'introduction',
+    'related work',
+    'background',
+    'method', 'methods',
+    'material and method', 'material and methods',
+    'materials and method', 'materials and methods',
+    'experiment', 'experiments',
+    'result', 'results',
+    'discussion',
+    'conclusion', 'conclusions',
+    'reference', 'references',
+    'bibliography',
+    'acknowledgment', 'acknowledgments',
+    'acknowledgement', 'acknowledgements',
+})
+
+
+def _pattern_group(name: str, patterns: List[str]) -> str:
+    """Combine patterns into one named alternation."""
+    alternation = '|'.join(f'(?:{p})' for p in patterns)
+    return f"(?P<{name}>{alternation})"
+
+
+# All text-based title rules in one pass. The alternation is tried in order,
+# so the first matching group reproduces the rule priority: a non-title match
+# rejects the text before any title pattern can accept it.
+_TITLE_PATTERNS_RE = re.compile('|'.join([
+    _pattern_group('non_title', _NON_TITLE_PATTERNS),
+    _pattern_group('numbered', _NUMBERED_SECTION_PATTERNS),
+    _pattern_group('special_header', _SPECIAL_HEADER_PATTERNS),
+]))
+
+
+@dataclass(slots=True)
+class StructuredBlock:
+    """A text block of a page, with the signals used for title detection."""
+    # Stripped at ingestion; consumers can rely on it
+    text: str
+    is_title: bool
+    page: int
+    avg_font_size: Optional[float] = None
+    bold_frac: Optional[float] = None
+    page_median_size: Optional[float] = None
+    # Span-level font info ('sizes', 'flags', 'texts'), kept for titles only
+    font_info: Optional[Dict] = None
+    
+    def get(self, key: str, default=None):
+        """Dict-style read access, so blocks can stand in for block dicts."""
+        return getattr(self, key, default)
 
 
 class EnhancedPDFProcessor:
@@ -16,11 +143,27 @@ class EnhancedPDFProcessor:
     Enhanced PDF processor using PyMuPDF for better structural analysis.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_detail_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        document_font_stats: bool = False
+    ):
         """
         Initialize enhanced PDF processor.
+        
+        Args:
+            max_detail_pages: Only run font-based title detection on the first
+                N pages; later pages use the cheaper plain block extraction.
+                None analyzes every page.
+            max_workers: Maximum worker processes for page extraction
+                (defaults to the CPU count, 1 disables multiprocessing)
+            document_font_stats: Calibrate the large-font title threshold from
+                a document-wide font size sweep instead of each page's median
         """
-        # No longer needed - we work directly with documents data
+        self.max_detail_pages = max_detail_pages
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.document_font_stats = document_font_stats
     
     def load_pdf_with_structure(self, pdf_path: str) -> List[Document]:
         """
@@ -32,204 +175,341 @@ class EnhancedPDFProcessor:
         Returns:
             List of Document objects with structural metadata
         """
-        pdf_path = Path(pdf_path)
+        return list(self.iter_pages_with_structure(pdf_path))
+    
+    def iter_pages_with_structure(self, pdf_path: str) -> Iterator[Document]:
+        """
+        Lazily load PDF pages with structural information, one Document per page.
+        Only the pages not yet consumed by the caller are held in memory.
         
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        Args:
+            pdf_path: Path to PDF file
+            
+        Yields:
+            Document objects with structural metadata, in page order
+        """
+        pdf_path = os.fspath(pdf_path)
+        source_name = os.path.basename(pdf_path)
         
-        if pdf_path.suffix.lower() != '.pdf':
+        # _map_pdf rejects files that MuPDF does not open as a PDF
+        try:
+            doc, pdf_view = _map_pdf(pdf_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        except (fitz.FileDataError, ValueError):
             raise ValueError(f"File is not a PDF: {pdf_path}")
         
         try:
-            doc = fitz.open(str(pdf_path))
-            documents = []
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_text = ""
-                structured_blocks = []
-                
-                # Get text blocks with formatting information
-                blocks = page.get_text("dict")["blocks"]
-                
-                # First pass: collect all font sizes to calculate median
-                all_page_sizes = []
-                for block in blocks:
-                    if "lines" in block:
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                all_page_sizes.append(span["size"])
-                
-                # Calculate page median font size
-                page_median_size = None
-                if all_page_sizes:
-                    all_page_sizes.sort()
-                    page_median_size = all_page_sizes[len(all_page_sizes) // 2]
-                
-                # Second pass: extract blocks and detect titles
-                for block in blocks:
-                    if "lines" in block:
-                        block_text = ""
-                        block_fonts = []
-                        
-                        for line in block["lines"]:
-                            line_text = ""
-                            line_fonts = []
-                            
-                            for span in line["spans"]:
-                                text = span["text"]
-                                font_size = span["size"]
-                                font_flags = span["flags"]  # Bold, italic, etc.
-                                
-                                line_text += text
-                                line_fonts.append({
-                                    'size': font_size,
-                                    'flags': font_flags,
-                                    'text': text
-                                })
-                            
-                            if line_text.strip():
-                                block_text += line_text + "\n"
-                                block_fonts.extend(line_fonts)
-                        
-                        if block_text.strip():
-                            # Determine if this block is likely a title
-                            text_for_judge = block_text.strip()
-                            is_title = self._is_likely_title(text_for_judge, block_fonts, page_median_size)
-                            
-                            structured_blocks.append({
-                                'text': block_text.strip(),
-                                'is_title': is_title,
-                                'page': page_num + 1,
-                                'font_info': block_fonts,
-                                'page_median_size': page_median_size
-                            })
-                            
-                            page_text += block_text + "\n"
+            for page in self._iter_pages(doc, pdf_path):
+                page_text = page['page_text'].strip()
                 
                 # Create document with structural metadata
-                if page_text.strip():
-                    doc_obj = Document(
-                        page_content=page_text.strip(),
+                if page_text:
+                    yield Document(
+                        page_content=page_text,
                         metadata={
-                            'source_file': pdf_path.name,
-                            'source_path': str(pdf_path),
-                            'page': page_num + 1,
-                            'structured_blocks': structured_blocks,
-                            'has_titles': any(block['is_title'] for block in structured_blocks)
+                            'source_file': source_name,
+                            'source_path': pdf_path,
+                            'page': page['page'],
+                            'structured_blocks': page['structured_blocks'],
+                            'has_titles': page['has_titles']
                         }
                     )
-                    documents.append(doc_obj)
-            
-            doc.close()
-            return documents
             
         except Exception as e:
             raise IOError(f"Failed to load PDF {pdf_path}: {str(e)}")
+        
+        finally:
+            _unmap_pdf(doc, pdf_view)
     
-    def _is_likely_title(self, text: str, font_info: List[Dict], page_median_size: Optional[float]=None) -> bool:
+    def _iter_pages(self, doc, pdf_path: str) -> Iterator[Dict]:
         """
-        Determine if text is likely a section title based on strict criteria.
+        Extract all pages of an open document, in-process or across workers.
         
         Args:
-            text: Text content to analyze
-            font_info: Font information for the text
-            page_median_size: Median font size for the page
+            doc: Open PyMuPDF document (closed early when workers are used)
+            pdf_path: Path to PDF file, reopened by each worker
+            
+        Yields:
+            Page dicts as produced by _extract_pages, in page order
+        """
+        page_count = len(doc)
+        page_ranges = self._page_ranges(page_count)
+        title_threshold = self._document_title_threshold(doc) if self.document_font_stats else None
+        
+        if len(page_ranges) <= 1:
+            yield from self._extract_pages(doc, 0, page_count, title_threshold)
+            return
+        
+        # Each worker reopens the PDF and extracts its own page range
+        doc.close()
+        starts, ends = zip(*page_ranges)
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(page_ranges))) as executor:
+            for page_range in executor.map(
+                _extract_page_range,
+                repeat(self),
+                repeat(pdf_path),
+                starts,
+                ends,
+                repeat(title_threshold)
+            ):
+                yield from page_range
+    
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        """
+        Split the page index range into [start, end) shards for workers.
+        
+        Args:
+            page_count: Number of pages in the document
             
         Returns:
-            True if text is likely a title, False otherwise
+            List of (start, end) page ranges, a single range for short documents
         """
-        t = ' '.join(text.split())
+        workers = min(self.max_workers, page_count // MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            return [(0, page_count)]
         
-        # Basic filters
-        if len(t) <= 3 or t.replace('.', '').replace('-', '').isdigit():
-            return False
+        # Several shards per worker so pages of uneven cost balance out
+        shards = min(workers * SHARDS_PER_WORKER, page_count // MIN_PAGES_PER_WORKER)
+        step = -(-page_count // shards)  # ceil division
+        return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    
+    def _document_title_threshold(self, doc) -> Optional[float]:
+        """
+        Compute a document-specific large-font threshold for title detection.
         
-        # Filter out common non-title patterns
-        non_title_patterns = [
-            r'^(example|proof|definition|proposition|theorem|lemma|corollary)\s*\d*',  # Mathematical terms
-            r'^(fig\.|figure|table|algorithm)\s+\d+',  # Figure/Table captions
-            r'^[a-z]',  # Starts with lowercase
-            r'^\d+$',  # Pure numbers
-            r'^[A-Za-z]\s*[=<>]',  # Mathematical expressions
-            r'^[A-Za-z]\s*[+\-*/]',  # Mathematical operations
-            r'^\w+\s*[=<>]\s*\w+',  # Equations
-            r'^[A-Za-z]\s*\(',  # Function calls
-            r'^\w+\s*:',  # Labels
-            r'^[A-Za-z]\s*[0-9]',  # Mixed alphanumeric without proper structure
+        Args:
+            doc: Open PyMuPDF document
+            
+        Returns:
+            max(1.2 x body text size, 95th percentile size), or None without text
+        """
+        sizes = [
+            span["size"]
+            for page in doc
+            for block in page.get_text("dict", flags=SIZE_SWEEP_FLAGS)["blocks"]
+            for line in block["lines"]
+            for span in line["spans"]
         ]
+        if not sizes:
+            return None
         
-        for pattern in non_title_patterns:
-            if re.match(pattern, t, re.I):
-                return False
-        
-        # 1) Numbered sections (strict pattern)
-        numbered_patterns = [
-            r'^\d+\s+[A-Z]',  # "1 Introduction"
-            r'^\d+\.\s*[A-Z]',  # "1. Introduction" (with optional space after dot)
-            r'^\d+\.\d+\s*[A-Z]',  # "1.1 Methods" (with optional space)
-            r'^\d+\.\d+\.\s*[A-Z]',  # "1.1. Details" (with optional space after dot)
-            r'^\d+\.\d+\.\d+\s*[A-Z]',  # "1.1.1 Details" (with optional space)
-            r'^\d+\.\d+\.\d+\.\s*[A-Z]',  # "1.1.1. Specifics" (with optional space after dot)
-            r'^\d+\.\d+\.\d+\.\d+\s*[A-Z]',  # "1.1.1.1 Specifics" (with optional space)
-            r'^\d+\n[A-Z]',  # "1\nIntroduction" (with line break)
-            r'^\d+\.\n[A-Z]',  # "1.\nIntroduction" (with line break)
-            r'^\d+\.\d+\n[A-Z]',  # "1.1\nMethods" (with line break)
-            r'^\d+\.\d+\.\n[A-Z]',  # "1.1.\nMethods" (with line break)
-            r'^\d+\.\d+\.\d+\n[A-Z]',  # "1.1.1\nDetails" (with line break)
-        ]
+        sizes = np.asarray(sizes, dtype=np.float64)
+        body_size = float(np.median(sizes))
+        return max(body_size * 1.2, float(np.percentile(sizes, 95)))
+    
+    def _extract_pages(self, doc, start: int, end: int, title_threshold: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Extract pages [start, end) of an open document.
         
-        for pattern in numbered_patterns:
-            if re.match(pattern, t):
-                return True
+        Args:
+            doc: Open PyMuPDF document
+            start: First page index (inclusive)
+            end: Last page index (exclusive)
+            title_threshold: Document-wide large-font threshold (None uses page medians)
+            
+        Yields:
+            Picklable page dicts with page number, text, blocks and title flag
+        """
+        for page_num in range(start, end):
+            page = doc[page_num]
+            
+            # Fast path: plain text blocks without span/font dictionaries
+            if self.max_detail_pages is not None and page_num >= self.max_detail_pages:
+                page_text, structured_blocks, has_titles = self._extract_plain_blocks(page, page_num)
+            else:
+                page_text, structured_blocks, has_titles = self._extract_detailed_blocks(page, page_num, title_threshold)
+            
+            # Release the MuPDF page before handing results to the consumer
+            del page
+            
+            yield {
+                'page': page_num + 1,
+                'page_text': page_text,
+                'structured_blocks': structured_blocks,
+                'has_titles': has_titles
+            }
+    
+    def _extract_plain_blocks(self, page, page_num: int) -> Tuple[str, List[StructuredBlock], bool]:
+        """
+        Extract text blocks without font information (no title detection).
         
-        # 2) Special headers (Figure, Table, Algorithm) - these ARE titles
-        special_headers = [
-            r'^Figure\s+\d+',
-            r'^Table\s+\d+',
-            r'^Algorithm\s+\d+',
-        ]
+        Args:
+            page: PyMuPDF page object
+            page_num: Zero-based page index
+            
+        Returns:
+            Tuple of (page text, structured blocks, whether any block is a title)
+        """
+        page_text_parts = []
+        structured_blocks = []
         
-        for pattern in special_headers:
-            if re.match(pattern, t, re.I):
-                return True
+        # Tuples of (x0, y0, x1, y1, text, block_no, block_type)
+        for block in page.get_text("blocks"):
+            block_text = block[4]
+            if block[6] != 0:
+                continue
+            
+            stripped_text = block_text.strip()
+            if stripped_text:
+                structured_blocks.append(StructuredBlock(
+                    text=stripped_text,
+                    is_title=False,
+                    page=page_num + 1
+                ))
+                
+                page_text_parts.append(block_text)
         
-        # 3) Common section names (only if they appear alone)
-        section_names = [
-            r'^Abstract$',
-            r'^Introduction$',
-            r'^Related Work$',
-            r'^Background$',
-            r'^Methods?$',
-            r'^Materials? and Methods?$',
-            r'^Experiments?$',
-            r'^Results?$',
-            r'^Discussion$',
-            r'^Conclusion$',
-            r'^Conclusions?$',
-            r'^References?$',  # Allow both "Reference" and "References"
-            r'^references?$',  # Allow lowercase versions
-            r'^Bibliography$',
-            r'^bibliography$',
-            r'^Acknowledgments?$',
-            r'^Acknowledgements?$',
-        ]
+        return "\n".join(page_text_parts), structured_blocks, False
+    
+    def _extract_detailed_blocks(
+        self,
+        page,
+        page_num: int,
+        title_threshold: Optional[float] = None
+    ) -> Tuple[str, List[StructuredBlock], bool]:
+        """
+        Extract text blocks with font information and detect titles.
         
-        for pattern in section_names:
-            if re.match(pattern, t, re.I):
-                return True
+        Args:
+            page: PyMuPDF page object
+            page_num: Zero-based page index
+            title_threshold: Document-wide large-font threshold (None uses the page median)
+            
+        Returns:
+            Tuple of (page text, structured blocks, whether any block is a title)
+        """
+        page_text_parts = []
+        structured_blocks = []
+        has_titles = False
         
-        # 4) Font-based analysis (only for very strong title signals)
-        sizes = [s.get('size', 0) for s in font_info] or [0]
-        is_large_font = any(s > page_median_size * 1.2 for s in sizes) if page_median_size else False
-        is_bold = any(s.get('flags', 0) & 16 for s in font_info)  # Bold flag
-        is_reasonable_length = 5 <= len(t) <= 100
+        # Single traversal of the MuPDF dict: every span size feeds the page
+        # median, while non-blank blocks are buffered for classification
+        all_page_sizes = []
+        candidate_blocks = []
+        for block in page.get_text("dict")["blocks"]:
+            if "lines" in block:
+                block_lines = []
+                block_sizes = []
+                block_flags = []
+                block_texts = []
+                
+                for line in block["lines"]:
+                    # Spans go straight into the block arrays; blank lines are rolled back
+                    line_start = len(block_texts)
+                    
+                    for span in line["spans"]:
+                        all_page_sizes.append(span["size"])
+                        block_sizes.append(span["size"])
+                        block_flags.append(span["flags"])  # Bold, italic, etc.
+                        block_texts.append(span["text"])
+                    
+                    line_text = "".join(block_texts[line_start:])
+                    if line_text.strip():
+                        block_lines.append(line_text)
+                    else:
+                        del block_sizes[line_start:]
+                        del block_flags[line_start:]
+                        del block_texts[line_start:]
+                
+                # Every kept line is newline-terminated
+                block_text = "\n".join(block_lines) + "\n" if block_lines else ""
+                stripped_text = block_text.strip()
+                if stripped_text:
+                    candidate_blocks.append((block_text, stripped_text, block_sizes, block_flags, block_texts))
         
-        # Only use font analysis for very strong title signals
-        return (is_large_font or is_bold) and is_reasonable_length
-
+        # Image-only (e.g. scanned) pages have no text spans: nothing to extract
+        if not all_page_sizes:
+            return "", structured_blocks, has_titles
+        
+        # Calculate page median font size (upper middle element, O(n) selection)
+        all_page_sizes = np.asarray(all_page_sizes, dtype=np.float64)
+        middle = all_page_sizes.size // 2
+        page_median_size = float(np.partition(all_page_sizes, middle)[middle])
+        
+        # Classify the buffered blocks now that the page median is known
+        for block_text, text_for_judge, block_sizes, block_flags, block_texts in candidate_blocks:
+            # Long blocks can only be titles through the text patterns,
+            # so their font arrays are built only once they qualify
+            font_info = None
+            if len(text_for_judge) <= FONT_CHECK_MAX_CHARS:
+                font_info = _build_font_info(block_sizes, block_flags, block_texts)
+            
+            # Determine if this block is likely a title
+            is_title = self._is_likely_title(text_for_judge, font_info, page_median_size, title_threshold)
+            if is_title:
+                has_titles = True
+            
+            # Font summary: vectorized when the font arrays exist,
+            # otherwise one fused pass over the span lists
+            if font_info is not None:
+                avg_font_size = float(font_info['sizes'].mean())
+                bold_spans = int(np.count_nonzero(font_info['flags'] & BOLD_FLAG))
+            else:
+                size_total = 0.0
+                bold_spans = 0
+                for size, flags in zip(block_sizes, block_flags):
+                    size_total += size
+                    if flags & BOLD_FLAG:
+                        bold_spans += 1
+                avg_font_size = size_total / len(block_sizes)
+            
+            # Span-level font info is only needed to validate titles later
+            if is_title:
+                font_info = font_info or _build_font_info(block_sizes, block_flags, block_texts)
+            
+            structured_blocks.append(StructuredBlock(
+                text=text_for_judge,
+                is_title=is_title,
+                page=page_num + 1,
+                avg_font_size=avg_font_size,
+                bold_frac=bold_spans / len(block_flags),
+                page_median_size=page_median_size,
+                font_info=font_info if is_title else None
+            ))
+            
+            page_text_parts.append(block_text)
+        
+        return "\n".join(page_text_parts), structured_blocks, has_titles
     
-    # split_documents method removed - no longer needed
+    def _is_likely_title(
+        self,
+        text: str,
+        font_info: Optional[Dict],
+        page_median_size: Optional[float]=None,
+        title_threshold: Optional[float]=None
+    ) -> bool:
+        """
+        Determine if text is likely a section title based on strict criteria.
+        
+        Args:
+            text: Text content to analyze
+            font_info: Font information for the text ('sizes', 'flags', 'texts'),
+                or None to skip the font-based checks
+            page_median_size: Median font size for the page
+            title_threshold: Font size above which text counts as large
+                (defaults to 1.2 x page_median_size)
+            
+        Returns:
+            True if text is likely a title, False otherwise
+        """
+        # Text-only verdict, cached per normalized text (running headers,
+        # recurring section names); None defers to the font signals
+        verdict = _classify_text(' '.join(text.split()))
+        if verdict is not None:
+            return verdict
+        if font_info is None:
+            return False
+        
+        # 4) Font-based analysis (only for very strong title signals):
+        # any span in a large font, or any bold span
+        if title_threshold is None and page_median_size:
+            title_threshold = page_median_size * 1.2
+        return bool(_has_large_or_bold_span(
+            font_info['sizes'],
+            font_info['flags'],
+            float(title_threshold) if title_threshold else np.inf
+        ))
     
     def process(self, pdf_path: str) -> List[Document]:
         """
@@ -252,8 +532,234 @@ class EnhancedPDFProcessor:
         
         return documents
     
-    # get_statistics method removed - no longer needed
+    @classmethod
+    def process_many(cls, pdf_paths: Iterable[str], **kwargs) -> Dict[str, List[Document]]:
+        """
+        Process several PDFs with one shared processor instance.
+        
+        Args:
+            pdf_paths: Paths to PDF files
+            **kwargs: Processor options (max_detail_pages, max_workers, document_font_stats)
+            
+        Returns:
+            Dictionary mapping each path to its processed Documents
+        """
+        processor = cls(**kwargs)
+        return {str(pdf_path): processor.process(pdf_path) for pdf_path in pdf_paths}
+    
+    def process_batch(self, pdf_paths: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, List[Document]]:
+        """
+        Process several PDFs in parallel, one file per worker process.
+        
+        Args:
+            pdf_paths: Paths to PDF files
+            max_workers: Maximum worker processes (defaults to the processor's max_workers)
+            
+        Returns:
+            Dictionary mapping each path to its processed Documents
+        """
+        pdf_paths = [str(pdf_path) for pdf_path in pdf_paths]
+        
+        # Files are the unit of parallelism, so workers extract their pages serially
+        serial_processor = copy.copy(self)
+        serial_processor.max_workers = 1
+        
+        with ProcessPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            results = executor.map(_process_one, repeat(serial_processor), pdf_paths)
+            return dict(zip(pdf_paths, results))
     
     def __repr__(self) -> str:
         """String representation of processor."""
-        return f"EnhancedPDFProcessor()"
+        return "EnhancedPDFProcessor()"
+
+
+@lru_cache(maxsize=4096)
+def _classify_text(t: str) -> Optional[bool]:
+    """
+    Classify whitespace-normalized block text using the text-only title rules.
+    
+    Args:
+        t: Block text with whitespace runs collapsed to single spaces
+        
+    Returns:
+        True or False when the text decides, None when font analysis must decide
+    """
+    # Basic filters
+    if len(t) <= 3:
+        return False
+    
+    # Letter-initial text is never a title: case-insensitively, the r'^[a-z]'
+    # non-title rule rejects it before any title pattern is tried. Screening
+    # the first character replaces that rule and lets the patterns drop re.I
+    c0 = t[0]
+    if (c0.isascii() and c0.isalpha()) or c0 in _FOLDED_LETTERS:
+        return False
+    
+    # Page numbers like "12" or "3-4"
+    if t.translate(_PAGENUM_PUNCT).isdigit():
+        return False
+    
+    # Text patterns, in priority order: common non-title patterns,
+    # 1) numbered sections, 2) special headers (Figure, Table, Algorithm)
+    match = _TITLE_PATTERNS_RE.match(t)
+    if match:
+        return match.group('non_title') is None
+    
+    # 3) Common section names (only if they appear alone)
+    if t.lower() in _SECTION_NAMES:
+        return True
+    
+    # 4) Font-based analysis is reserved for reasonably short texts
+    if not 5 <= len(t) <= 100:
+        return False
+    return None
+
+
+def _map_pdf(pdf_path: str) -> Tuple[fitz.Document, memoryview]:
+    """
+    Open a PDF from a read-only memory map of the file.
+    
+    The OS pages the file in on demand, and worker processes opening the
+    same file share those pages.
+    
+    Args:
+        pdf_path: Path to PDF file
+        
+    Returns:
+        Tuple of (open document, view of the mapping backing it)
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is empty or not a PDF
+        fitz.FileDataError: If the file is not a valid PDF
+    """
+    with open(pdf_path, 'rb') as f:
+        pdf_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    pdf_view = memoryview(pdf_map)
+    try:
+        doc = fitz.open(stream=pdf_view, filetype="pdf")
+        
+        # filetype is only a hint: MuPDF still opens e.g. images by content
+        if not doc.is_pdf:
+            doc.close()
+            raise ValueError("File is not a PDF")
+        return doc, pdf_view
+    except Exception:
+        pdf_view.release()
+        pdf_map.close()
+        raise
+
+
+def _unmap_pdf(doc: fitz.Document, pdf_view: memoryview) -> None:
+    """
+    Close a document opened by _map_pdf and release its memory map.
+    
+    Args:
+        doc: Document returned by _map_pdf (may already be closed)
+        pdf_view: View returned alongside the document
+    """
+    if not doc.is_closed:
+        doc.close()
+    
+    # The document keeps a reference to the view, so it is released explicitly
+    pdf_map = pdf_view.obj
+    pdf_view.release()
+    pdf_map.close()
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _has_large_or_bold_span(sizes, flags, threshold):
+        """
+        Check whether any span is larger than threshold or set in bold.
+        
+        Both reductions are fused into one compiled loop that stops at the
+        first hit.
+        
+        Args:
+            sizes: Font size of each span
+            flags: Font flags of each span
+            threshold: Font size above which a span counts as large
+            
+        Returns:
+            True if at least one span is large or bold
+        """
+        for i in range(sizes.shape[0]):
+            if sizes[i] > threshold or flags[i] & BOLD_FLAG:
+                return True
+        return False
+else:
+    def _has_large_or_bold_span(sizes: np.ndarray, flags: np.ndarray, threshold: float) -> bool:
+        """
+        Check whether any span is larger than threshold or set in bold.
+        
+        Args:
+            sizes: Font size of each span
+            flags: Font flags of each span
+            threshold: Font size above which a span counts as large
+            
+        Returns:
+            True if at least one span is large or bold
+        """
+        return bool((sizes > threshold).any()) or bool((flags & BOLD_FLAG).any())
+
+
+def _build_font_info(sizes: List[float], flags: List[int], texts: List[str]) -> Dict:
+    """
+    Pack per-span font information into parallel arrays.
+    
+    Args:
+        sizes: Font size of each span
+        flags: Font flags of each span (bold, italic, etc.)
+        texts: Text of each span
+        
+    Returns:
+        Dictionary with 'sizes', 'flags' arrays and the 'texts' list
+    """
+    return {
+        'sizes': np.asarray(sizes, dtype=np.float64),
+        'flags': np.asarray(flags, dtype=np.uint32),
+        'texts': texts
+    }
+
+
+def _process_one(processor: EnhancedPDFProcessor, pdf_path: str) -> List[Document]:
+    """
+    Worker entry point: process one whole PDF in a child process.
+    
+    Args:
+        processor: Processor carrying the extraction options
+        pdf_path: Path to PDF file
+        
+    Returns:
+        List of processed Documents
+    """
+    return processor.process(pdf_path)
+
+
+def _extract_page_range(
+    processor: EnhancedPDFProcessor,
+    pdf_path: str,
+    start: int,
+    end: int,
+    title_threshold: Optional[float]
+) -> List[Dict]:
+    """
+    Worker entry point: extract pages [start, end) of a PDF in a child process.
+    
+    Args:
+        processor: Processor carrying the extraction options
+        pdf_path: Path to PDF file
+        start: First page index (inclusive)
+        end: Last page index (exclusive)
+        title_threshold: Document-wide large-font threshold, if computed
+        
+    Returns:
+        List of page dicts as produced by EnhancedPDFProcessor._extract_pages
+    """
+    doc, pdf_view = _map_pdf(pdf_path)
+    try:
+        return list(processor._extract_pages(doc, start, end, title_threshold))
+    finally:
+        _unmap_pdf(doc, pdf_view)
@@ -2,17 +2,34 @@
 Main application entry point.
 Orchestrates PDF processing and summarization pipeline.
 """
+import copy
+import hashlib
 import json
+import logging
+import multiprocessing
+import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
 from datetime import datetime
 
 from enhanced_pdf_processor import EnhancedPDFProcessor
 from config import config
-from summarizer import Summarizer
+from summarizer import Summarizer, TOC_PROMPT_PREFIX, dumps_json
 from langchain_core.documents import Document
 
+logger = logging.getLogger("pdf_sum")
+
+# Bump when title extraction or table-of-contents formatting changes, so
+# cached tables of contents from older code are not reused
+_SUMMARY_CACHE_VERSION = 1
+
 
 class PDFSummarizationPipeline:
     """
@@ -22,7 +39,9 @@ class PDFSummarizationPipeline:
     def __init__(
         self,
         input_dir: str = "/app/data/input",
-        output_dir: str = "/app/data/output"
+        output_dir: str = "/app/data/output",
+        max_workers: int = None,
+        batch_summaries: Optional[bool] = None
     ):
         """
         Initialize pipeline.
@@ -30,9 +49,15 @@ class PDFSummarizationPipeline:
         Args:
             input_dir: Directory containing PDF files
             output_dir: Directory for output summaries
+            max_workers: Maximum PDFs processed in parallel (defaults to CPU count)
+            batch_summaries: Extract all PDFs first, then summarize them with
+                one batched LLM call (keeps every extracted PDF in memory;
+                defaults to config value)
         """
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_summaries = config.batch_summaries if batch_summaries is None else batch_summaries
         
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -41,11 +66,11 @@ class PDFSummarizationPipeline:
         self.processor = EnhancedPDFProcessor()
         self.summarizer = Summarizer()
         
-        print("Pipeline initialized:")
-        print(f"  Input dir: {self.input_dir}")
-        print(f"  Output dir: {self.output_dir}")
-        print(f"  Processor: {self.processor}")
-        print(f"  Summarizer: {self.summarizer}")
+        logger.info("Pipeline initialized:")
+        logger.info("  Input dir: %s", self.input_dir)
+        logger.info("  Output dir: %s", self.output_dir)
+        logger.info("  Processor: %s", self.processor)
+        logger.info("  Summarizer: %s", self.summarizer)
     
     def find_pdf_files(self) -> List[Path]:
         """
@@ -55,18 +80,56 @@ class PDFSummarizationPipeline:
             List of PDF file paths
         """
         if not self.input_dir.exists():
-            print(f"Warning: Input directory does not exist: {self.input_dir}")
+            logger.warning("Warning: Input directory does not exist: %s", self.input_dir)
             return []
         
-        return sorted(self.input_dir.glob("*.pdf"))
+        # Only matching entries are wrapped in Path objects
+        with os.scandir(self.input_dir) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            )
     
     def save_json(self, data: Dict, output_path: Path):
         """Save data as JSON file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(dumps_json(data))
+    
+    def save_json_stream(self, data: Dict, output_path: Path):
+        """
+        Save data as JSON file, writing iterator values one element at a time.
+        The file has the same layout as save_json, but iterator values are
+        never materialized as lists.
+        
+        Args:
+            data: Top-level object; iterator values are written as JSON arrays
+            output_path: Destination file
+        """
+        if not data:
+            self.save_json(data, output_path)
+            return
+        
+        with open(output_path, 'wb') as f:
+            separator = b'{\n  '
+            for key, value in data.items():
+                f.write(separator)
+                f.write(dumps_json(key) + b': ')
+                separator = b',\n  '
+                
+                if not isinstance(value, Iterator):
+                    f.write(dumps_json(value).replace(b'\n', b'\n  '))
+                    continue
+                
+                item_separator = b'[\n    '
+                for item in value:
+                    f.write(item_separator)
+                    f.write(dumps_json(item).replace(b'\n', b'\n    '))
+                    item_separator = b',\n    '
+                f.write(b'[]' if item_separator == b'[\n    ' else b'\n  ]')
+            f.write(b'\n}')
     
     
-    def process_single_pdf(self, pdf_path: Path) -> Dict:
+    def process_single_pdf(self, pdf_path: Path) -> Tuple[Dict, List[Document]]:
         """
         Process a single PDF file through the complete pipeline.
         
@@ -74,48 +137,124 @@ class PDFSummarizationPipeline:
             pdf_path: Path to PDF file
             
         Returns:
-            Dictionary with summary and metadata
+            Tuple of (dictionary with summary and metadata, extracted page Documents)
             
         Raises:
             Exception: If processing fails
         """
-        print(f"\n{'='*60}")
-        print(f"Processing: {pdf_path.name}")
-        print(f"{'='*60}")
+        logger.info("\n%s", "=" * 60)
+        logger.info("Processing: %s", pdf_path.name)
+        logger.info("=" * 60)
         
         # Step 1: Extract and chunk text
-        print("\n[1/3] Extracting and chunking text...")
-        documents = self.processor.load_pdf_with_structure(pdf_path)
+        logger.info("\n[1/3] Extracting and chunking text...")
+        documents, documents_data = self.extract_documents(pdf_path)
         
         # Step 2: Generate summary
-        print("\n[2/3] Generating summary with LLM...")
-        print(f"  Model: {self.summarizer.model}")
-        
-        # Get documents data for title extraction from current documents
-        documents_data = []
-        for doc in documents:
-            if hasattr(doc, 'metadata') and 'structured_blocks' in doc.metadata:
-                for block in doc.metadata['structured_blocks']:
-                    documents_data.append({
-                        'text': block.get('text', ''),
-                        'is_title': block.get('is_title', False),
-                        'page': block.get('page', ''),
-                        'font_info': block.get('font_info', []),
-                        'page_median_size': block.get('page_median_size', None)
-                    })
+        logger.info("\n[2/3] Generating summary with LLM...")
+        logger.info("  Model: %s", self.summarizer.model)
         
-        summary, titles_data = self.summarizer.summarize([], documents_data)  # Empty chunks list
+        # Reuse the table of contents of an identical earlier extraction
+        cache_path = self._summary_cache_path(documents_data)
+        cached = self._load_cached_summary(cache_path)
+        if cached is not None:
+            summary, titles_data = cached
+            logger.info("  ✓ Reused cached table of contents")
+        else:
+            summary, titles_data = self.summarizer.summarize([], documents_data)  # Empty chunks list
+            self._store_cached_summary(cache_path, summary, titles_data)
         
-        print(f"  ✓ Table of contents generated ({len(summary)} characters)")
+        logger.info("  ✓ Table of contents generated (%d characters)", len(summary))
         
         # Step 3: Format output
-        print("\n[3/3] Formatting output...")
+        logger.info("\n[3/3] Formatting output...")
         result = self.summarizer.format_output(summary, documents_data, titles_data=titles_data)
         
-        # Store documents for potential saving
-        self._last_documents = documents
+        return result, documents
+    
+    def extract_documents(self, pdf_path: Path) -> Tuple[List[Document], List]:
+        """
+        Extract the pages of a PDF and gather their structured blocks.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Tuple of (page Documents, structured blocks of all pages)
+        """
+        # Pages are consumed as extraction workers finish them; their blocks
+        # are gathered (by reference) for title extraction in the same pass
+        documents = []
+        documents_data = []
+        for doc in self.processor.iter_pages_with_structure(pdf_path):
+            documents.append(doc)
+            documents_data.extend(doc.metadata.get('structured_blocks', ()))
         
-        return result
+        return documents, documents_data
+    
+    def _summary_cache_path(self, documents_data: List) -> Optional[Path]:
+        """Cache file for a document's table of contents, or None when caching is off."""
+        if not config.enable_summary_cache:
+            return None
+        return self.output_dir / ".cache" / f"{self._summary_cache_key(documents_data)}.json"
+    
+    def _load_cached_summary(self, cache_path: Optional[Path]) -> Optional[Tuple[str, List[Dict]]]:
+        """Read (summary, titles_data) from the cache, or None on a miss."""
+        if cache_path is None:
+            return None
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            return cached['summary'], cached['titles_data']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Unreadable or half-written entry: recompute and overwrite it
+            logger.warning("Ignoring corrupt summary cache entry %s: %s", cache_path.name, e)
+            return None
+    
+    def _store_cached_summary(self, cache_path: Optional[Path], summary: str, titles_data: List[Dict]):
+        """Write (summary, titles_data) to the cache when caching is on."""
+        if cache_path is None:
+            return
+        cache_path.parent.mkdir(exist_ok=True)
+        
+        # Write to a temporary file and rename it into place, so concurrent
+        # readers never see a partly written entry
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dumps_json({'summary': summary, 'titles_data': titles_data}))
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    
+    def _summary_cache_key(self, documents_data: List) -> str:
+        """
+        Hash everything the table of contents depends on.
+        
+        Args:
+            documents_data: Structured blocks passed to the summarizer
+            
+        Returns:
+            Hex digest identifying the summarizer input, prompt and LLM settings
+        """
+        h = hashlib.blake2b(digest_size=20)
+        h.update(repr((
+            _SUMMARY_CACHE_VERSION, TOC_PROMPT_PREFIX,
+            self.summarizer.model, self.summarizer.temperature,
+            self.summarizer.max_tokens, self.summarizer.force_llm
+        )).encode())
+        for block in documents_data:
+            h.update(f"\0{block.page}\0{block.is_title:d}\0{block.text}".encode())
+            
+            # Title validation also reads the span fonts of title blocks
+            if block.font_info is not None:
+                h.update(block.font_info['sizes'].tobytes())
+                h.update("\0".join(block.font_info['texts']).encode())
+            if block.page_median_size is not None:
+                h.update(repr(block.page_median_size).encode())
+        return h.hexdigest()
     
     def save_outputs(self, result: Dict, pdf_name: str, documents: List[Document] = None):
         """
@@ -136,122 +275,284 @@ class PDFSummarizationPipeline:
         # Save summary JSON
         output_path = pdf_folder / "summary.json"
         self.save_json(result, output_path)
-        print(f"  ✓ Saved JSON: {pdf_folder.name}/summary.json")
+        logger.info("  ✓ Saved JSON: %s/summary.json", pdf_folder.name)
         
-        # Save AI-generated TOC as Markdown
+        # Save AI-generated TOC as Markdown (left untouched when identical,
+        # e.g. on a re-run served from the summary cache)
         if 'ai_generated_toc' in result:
             markdown_path = pdf_folder / "table_of_contents.md"
-            with open(markdown_path, 'w', encoding='utf-8') as f:
-                f.write(result['ai_generated_toc'])
-            print(f"  ✓ Saved Markdown: {pdf_folder.name}/table_of_contents.md")
+            toc = result['ai_generated_toc']
+            if markdown_path.is_file() and markdown_path.read_text(encoding='utf-8') == toc:
+                logger.info("  ✓ Markdown unchanged: %s/table_of_contents.md", pdf_folder.name)
+            else:
+                markdown_path.write_text(toc, encoding='utf-8')
+                logger.info("  ✓ Saved Markdown: %s/table_of_contents.md", pdf_folder.name)
         
-        # Save original documents if available
+        # Save original documents if available, one page at a time
         if documents:
-            documents_data = []
-            for i, doc in enumerate(documents):
-                doc_data = {
-                    'document_index': i,
-                    'page': doc.metadata.get('page', 'unknown'),
-                    'content': doc.page_content,
-                    'content_length': len(doc.page_content),
-                    'source_file': doc.metadata.get('source_file', 'unknown'),
-                    'has_titles': doc.metadata.get('has_titles', False)
-                }
-                
-                if 'structured_blocks' in doc.metadata:
-                    doc_data['structured_blocks'] = []
-                    for block in doc.metadata['structured_blocks']:
-                        doc_data['structured_blocks'].append({
-                            'text': block['text'],
-                            'is_title': block['is_title'],
-                            'page': block['page'],
-                            'text_length': len(block['text'])
-                        })
-                
-                documents_data.append(doc_data)
-            
             documents_output = {
                 'source_file': pdf_name,
                 'total_documents': len(documents),
-                'documents': documents_data,
+                'documents': self._iter_documents_data(documents),
                 'timestamp': result['metadata']['timestamp']
             }
             
             documents_path = pdf_folder / "documents.json"
-            self.save_json(documents_output, documents_path)
-            print(f"  ✓ Saved documents: {pdf_folder.name}/documents.json")
+            self.save_json_stream(documents_output, documents_path)
+            logger.info("  ✓ Saved documents: %s/documents.json", pdf_folder.name)
+            
+    
+    def _iter_documents_data(self, documents: List[Document]) -> Iterator[Dict]:
+        """
+        Build the documents.json entry of each page lazily.
+        
+        Args:
+            documents: Page Documents produced by the processor
+            
+        Yields:
+            JSON-ready dictionary for each document, in order
+        """
+        for i, doc in enumerate(documents):
+            doc_data = {
+                'document_index': i,
+                'page': doc.metadata.get('page', 'unknown'),
+                'content': doc.page_content,
+                'content_length': len(doc.page_content),
+                'source_file': doc.metadata.get('source_file', 'unknown'),
+                'has_titles': doc.metadata.get('has_titles', False)
+            }
+            
+            if 'structured_blocks' in doc.metadata:
+                doc_data['structured_blocks'] = [
+                    {
+                        'text': block.text,
+                        'is_title': block.is_title,
+                        'page': block.page,
+                        'text_length': len(block.text)
+                    }
+                    for block in doc.metadata['structured_blocks']
+                ]
+            
+            yield doc_data
+    
+    def process_and_save(self, pdf_path: Path, idx: int, total: int) -> Dict:
+        """
+        Process one PDF and save its outputs, recording failures instead of raising.
+        
+        Args:
+            pdf_path: Path to PDF file
+            idx: Position of the file in the run (1-based)
+            total: Number of files in the run
+            
+        Returns:
+            Processing log entry for the file
+        """
+        try:
+            logger.info("\n\n[%d/%d] Processing %s", idx, total, pdf_path.name)
+            
+            # Process PDF
+            result, documents = self.process_single_pdf(pdf_path)
+            
+            # Save outputs
+            self.save_outputs(result, pdf_path.name, documents)
+            
+            return self._success_entry(pdf_path, result)
+            
+        except Exception as e:
+            return self._failure_entry(pdf_path, e)
+    
+    def process_and_save_serial(self, pdf_files: List[Path]) -> List[Dict]:
+        """
+        Process and save several PDFs in this process, one after another.
+        Each PDF's outputs are written by a background thread while the
+        next PDF is being processed.
+        
+        Args:
+            pdf_files: Paths to PDF files
+            
+        Returns:
+            Processing log entry for each file, in input order
+        """
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as io_pool:
+            pending = []
+            for idx, pdf_path in enumerate(pdf_files, 1):
+                try:
+                    logger.info("\n\n[%d/%d] Processing %s", idx, len(pdf_files), pdf_path.name)
+                    result, documents = self.process_single_pdf(pdf_path)
+                    pending.append((pdf_path, result, io_pool.submit(self.save_outputs, result, pdf_path.name, documents)))
+                except Exception as e:
+                    pending.append((pdf_path, None, e))
             
+            for pdf_path, result, outcome in pending:
+                try:
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    outcome.result()
+                    results.append(self._success_entry(pdf_path, result))
+                except Exception as e:
+                    results.append(self._failure_entry(pdf_path, e))
+        
+        return results
+    
+    def process_and_save_batched(self, pdf_files: List[Path]) -> List[Dict]:
+        """
+        Process and save several PDFs, summarizing them with one batched LLM call.
+        
+        Args:
+            pdf_files: Paths to PDF files
+            
+        Returns:
+            Processing log entry for each file, in input order
+        """
+        # Step 1: Extract every PDF, in worker processes when available
+        logger.info("\n[1/3] Extracting and chunking text of all PDFs...")
+        workers = min(self.max_workers, len(pdf_files))
+        if workers > 1:
+            with _worker_pool(workers) as executor:
+                extracted = list(executor.map(_try_extract_documents, repeat(self._worker_copy()), pdf_files))
+        else:
+            extracted = [_try_extract_documents(self, pdf_path) for pdf_path in pdf_files]
+        
+        # Step 2: One batched request for every PDF without a cached summary
+        logger.info("\n[2/3] Generating summaries with LLM...")
+        logger.info("  Model: %s", self.summarizer.model)
+        cache_paths = [None] * len(pdf_files)
+        summaries = [None] * len(pdf_files)
+        uncached = []
+        for i, item in enumerate(extracted):
+            if isinstance(item, Exception):
+                continue
+            cache_paths[i] = self._summary_cache_path(item[1])
+            summaries[i] = self._load_cached_summary(cache_paths[i])
+            if summaries[i] is None:
+                uncached.append(i)
+        
+        if uncached:
+            batch = self.summarizer.summarize_batch([extracted[i][1] for i in uncached])
+            for i, summary in zip(uncached, batch):
+                summaries[i] = summary
+        logger.info("  ✓ %d summarized, %d cached or failed", len(uncached), len(pdf_files) - len(uncached))
+        
+        # Step 3: Format and save each PDF
+        logger.info("\n[3/3] Formatting output...")
+        results = []
+        for i, pdf_path in enumerate(pdf_files):
+            try:
+                for outcome in (extracted[i], summaries[i]):
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                
+                documents, documents_data = extracted[i]
+                summary, titles_data = summaries[i]
+                if i in uncached:
+                    self._store_cached_summary(cache_paths[i], summary, titles_data)
+                
+                result = self.summarizer.format_output(summary, documents_data, titles_data=titles_data)
+                self.save_outputs(result, pdf_path.name, documents)
+                results.append(self._success_entry(pdf_path, result))
+                
+            except Exception as e:
+                results.append(self._failure_entry(pdf_path, e))
+        
+        return results
+    
+    def _success_entry(self, pdf_path: Path, result: Dict) -> Dict:
+        """Processing log entry for a saved PDF."""
+        return {
+            "file": pdf_path.name,
+            "status": "success",
+            "summary_length": len(result['ai_generated_toc'])
+        }
+    
+    def _failure_entry(self, pdf_path: Path, error: Exception) -> Dict:
+        """Report a failed PDF and build its processing log entry."""
+        logger.error("\nError processing %s:", pdf_path.name)
+        logger.error("   %s", error)
+        
+        return {
+            "file": pdf_path.name,
+            "status": "failed",
+            "error": str(error)
+        }
+    
+    def _worker_copy(self) -> "PDFSummarizationPipeline":
+        """Copy of the pipeline for worker processes, extracting pages serially."""
+        # Files are the unit of parallelism, so workers extract their pages serially
+        worker_pipeline = copy.copy(self)
+        worker_pipeline.processor = copy.copy(self.processor)
+        worker_pipeline.processor.max_workers = 1
+        return worker_pipeline
+    
+    def __getstate__(self) -> Dict:
+        """Pickle support for worker processes: the LLM client is rebuilt, not copied."""
+        state = self.__dict__.copy()
+        summarizer = state.pop('summarizer')
+        state['_summarizer_args'] = (
+            summarizer.model, summarizer.temperature, summarizer.max_tokens, summarizer.force_llm
+        )
+        return state
+    
+    def __setstate__(self, state: Dict):
+        """Restore a pickled pipeline with a fresh summarizer."""
+        model, temperature, max_tokens, force_llm = state.pop('_summarizer_args')
+        self.__dict__.update(state)
+        self.summarizer = Summarizer(
+            model=model, temperature=temperature, max_tokens=max_tokens, force_llm=force_llm
+        )
     
     def run(self):
         """
         Run the complete pipeline on all PDFs in input directory.
         """
-        print("\n" + "="*60)
-        print("PDF SUMMARIZATION PIPELINE")
-        print("="*60)
+        logger.info("\n%s", "=" * 60)
+        logger.info("PDF SUMMARIZATION PIPELINE")
+        logger.info("=" * 60)
         
         # Find PDF files
         pdf_files = self.find_pdf_files()
         
         if not pdf_files:
-            print("\n No PDF files found in input directory!")
-            print(f"   Please place PDF files in: {self.input_dir}")
+            logger.warning("\n No PDF files found in input directory!")
+            logger.warning("   Please place PDF files in: %s", self.input_dir)
             return
         
-        print(f"\nFound {len(pdf_files)} PDF file(s) to process:")
+        logger.info("\nFound %d PDF file(s) to process:", len(pdf_files))
         for pdf in pdf_files:
-            print(f"  - {pdf.name}")
+            logger.info("  - %s", pdf.name)
         
-        results = []
-        successful = 0
-        failed = 0
+        # PDFs are independent, so each one goes to its own worker process
+        workers = min(self.max_workers, len(pdf_files))
+        if self.batch_summaries:
+            results = self.process_and_save_batched(pdf_files)
+        elif workers > 1:
+            with _worker_pool(workers) as executor:
+                results = list(executor.map(
+                    _process_and_save,
+                    repeat(self._worker_copy()),
+                    pdf_files,
+                    range(1, len(pdf_files) + 1),
+                    repeat(len(pdf_files))
+                ))
+        else:
+            results = self.process_and_save_serial(pdf_files)
         
-        for idx, pdf_path in enumerate(pdf_files, 1):
-            try:
-                print(f"\n\n[{idx}/{len(pdf_files)}] Processing {pdf_path.name}")
-                
-                # Process PDF
-                result = self.process_single_pdf(pdf_path)
-                
-                # Get documents for saving (if available)
-                documents = None
-                if hasattr(self, '_last_documents'):
-                    documents = self._last_documents
-                
-                # Save outputs
-                self.save_outputs(result, pdf_path.name, documents)
-                
-                results.append({
-                    "file": pdf_path.name,
-                    "status": "success",
-                    "summary_length": len(result['ai_generated_toc'])
-                })
-                successful += 1
-                
-            except Exception as e:
-                print(f"\nError processing {pdf_path.name}:")
-                print(f"   {str(e)}")
-                
-                results.append({
-                    "file": pdf_path.name,
-                    "status": "failed",
-                    "error": str(e)
-                })
-                failed += 1
+        successful = sum(1 for r in results if r["status"] == "success")
+        failed = len(results) - successful
         
         # Print summary
-        print("\n\n" + "="*60)
-        print("PIPELINE COMPLETED")
-        print("="*60)
-        print(f"\nTotal PDFs: {len(pdf_files)}")
-        print(f"✓ Successful: {successful}")
+        logger.info("\n\n%s", "=" * 60)
+        logger.info("PIPELINE COMPLETED")
+        logger.info("=" * 60)
+        logger.info("\nTotal PDFs: %d", len(pdf_files))
+        logger.info("✓ Successful: %d", successful)
         if failed > 0:
-            print(f"✗ Failed: {failed}")
+            logger.info("✗ Failed: %d", failed)
         
-        print(f"\nOutputs saved to: {self.output_dir}")
+        logger.info("\nOutputs saved to: %s", self.output_dir)
         
         # Save processing log
-        log_path = self.output_dir / f"processing_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        log_path = self.output_dir / f"processing_log_{time.strftime('%Y%m%d_%H%M%S')}.json"
         self.save_json({
             "timestamp": datetime.now().isoformat(),
             "total_files": len(pdf_files),
@@ -259,18 +560,94 @@ class PDFSummarizationPipeline:
             "failed": failed,
             "results": results
         }, log_path)
-        print(f"Processing log: {log_path.name}")
+        logger.info("Processing log: %s", log_path.name)
         
         return successful, failed
 
 
+@contextmanager
+def _worker_pool(max_workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    Process pool whose workers log through this process.
+    
+    Workers put their log records on a queue; one listener thread here hands
+    them to the configured handlers, so workers never contend for stdout.
+    
+    Args:
+        max_workers: Number of worker processes
+        
+    Yields:
+        The running executor
+    """
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_logging,
+            initargs=(log_queue, logger.getEffectiveLevel())
+        ) as executor:
+            yield executor
+    finally:
+        listener.stop()
+
+
+def _init_worker_logging(log_queue: multiprocessing.Queue, level: int):
+    """
+    Worker initializer: route all log records to the parent's listener.
+    
+    Args:
+        log_queue: Queue drained by the parent's QueueListener
+        level: Log level of the parent's pipeline logger
+    """
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _process_and_save(pipeline: PDFSummarizationPipeline, pdf_path: Path, idx: int, total: int) -> Dict:
+    """
+    Worker entry point: process and save one PDF in a child process.
+    
+    Args:
+        pipeline: Pipeline carrying the processing options
+        pdf_path: Path to PDF file
+        idx: Position of the file in the run (1-based)
+        total: Number of files in the run
+        
+    Returns:
+        Processing log entry for the file
+    """
+    return pipeline.process_and_save(pdf_path, idx, total)
+
+
+def _try_extract_documents(pipeline: PDFSummarizationPipeline, pdf_path: Path):
+    """
+    Worker entry point: extract one PDF, returning the error instead of raising.
+    
+    Args:
+        pipeline: Pipeline carrying the processing options
+        pdf_path: Path to PDF file
+        
+    Returns:
+        (documents, documents_data) as from extract_documents, or the exception raised
+    """
+    try:
+        return pipeline.extract_documents(pdf_path)
+    except Exception as e:
+        return e
+
+
 def main():
     """Main entry point."""
+    logging.basicConfig(level=config.log_level, format="%(message)s", stream=sys.stdout)
+    
     try:
         # Check for required environment variables
         if not config.openai_api_key:
-            print("\n Error: OPENAI_API_KEY not set!")
-            print("   Please set it in .env file or environment variables.")
+            logger.error("\n Error: OPENAI_API_KEY not set!")
+            logger.error("   Please set it in .env file or environment variables.")
             sys.exit(1)
         
         # Create and run pipeline
@@ -284,13 +661,11 @@ def main():
             sys.exit(0)
             
     except KeyboardInterrupt:
-        print("\n\n Pipeline interrupted by user")
+        logger.warning("\n\n Pipeline interrupted by user")
         sys.exit(130)
     
     except Exception as e:
-        print(f"\n\n❌ Fatal error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("\n\n❌ Fatal error: %s", e)
         sys.exit(1)
 
 
@@ -1,11 +1,91 @@
+import asyncio
+import json
 import re
-from typing import List, Dict, Any, Optional
+import time
+import numpy as np
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from datetime import datetime
 from langchain_openai import ChatOpenAI
+from openai import OpenAI
 from langchain_core.documents import Document
+from langchain_core.globals import set_llm_cache
 
 from config import config
 
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
+try:
+    from langchain_community.cache import SQLiteCache
+except ImportError:  # optional: only needed when LLM_CACHE_PATH is set
+    SQLiteCache = None
+
+# Maximum number of LLM requests summarize_batch / asummarize_batch keep in flight
+BATCH_MAX_CONCURRENCY = 8
+
+# Seconds between status checks of an OpenAI Batch API job
+OFFLINE_BATCH_POLL_SECONDS = 30
+
+# Seconds summarize_batch_offline waits for an OpenAI Batch API job before
+# cancelling it (the job's own completion window is 24 hours)
+OFFLINE_BATCH_TIMEOUT_SECONDS = 24 * 60 * 60
+
+# Terminal states of an OpenAI Batch API job
+_OFFLINE_BATCH_DONE = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+# Static head of every table-of-contents prompt. Kept byte-identical and in
+# front of the per-document titles so provider-side prompt caching can reuse it
+TOC_PROMPT_PREFIX = """Format these section titles as a markdown table of contents.
+- Keep the EXACT order given; do not reorder or regroup sections.
+- Number the entries.
+- Include page numbers where available.
+- Skip person names (e.g. "David M. Blei", "J. Smith et al.") that appear more than once.
+
+Section titles (in order):
+"""
+
+# Table of contents given for a document without section titles
+NO_TITLES_MESSAGE = "No section titles found in the document."
+
+# Standard section titles (lowercased), always accepted as titles
+_STANDARD_SECTIONS = frozenset(s.lower() for s in [
+    'Abstract', 'Introduction', 'Related Work', 'Background',
+    'Methods', 'Materials and Methods', 'Experiments', 'Results',
+    'Discussion', 'Conclusion', 'Conclusions', 'References',
+    'Bibliography', 'Acknowledgments', 'Acknowledgements'
+])
+
+# Common non-title patterns (but keep it minimal), as one alternation
+_NON_TITLE_PATTERNS = [
+    r'^As in \[',  # "As in [19] and unlike [18]"
+]
+_NON_TITLE_RE = re.compile('|'.join(f'(?:{p})' for p in _NON_TITLE_PATTERNS))
+
+# Runs of digits in a title
+_DIGITS_RE = re.compile(r'\d+')
+
+# Characters other than word characters, whitespace, dots, dashes and parentheses
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s\.\-\(\)]')
+
+# Numbered section titles like "1 Introduction" or "2.1. Methods"; the match
+# ends where the title text starts
+_NUM_PREFIX_RE = re.compile(r'^(\d+(?:\.\d+)*)\.?\s+(?=\S)')
+
+# Titles that look like a person's name, e.g. "David M. Blei", "John D. Lafferty"
+# or a running header's "G. Audemard et al." (page-number prefix stripped first)
+_INITIAL = r'[A-Z]\.(?:-[A-Z]\.)?'
+_NAME_WORD = r'[A-Z][a-z]+(?:-[A-Z][a-z]+)*'
+_PERSON_NAME_RE = re.compile(
+    rf'^(?:{_INITIAL}|{_NAME_WORD})(?:\s+{_INITIAL}){{0,2}}\s+{_NAME_WORD}(?:,?\s+et\s+al\.?)?$'
+)
+
+# Initials or "et al.": what sets a name apart from a two-word section title
+_NAME_MARKER_RE = re.compile(rf'(?:^|\s){_INITIAL}\s|\set\s+al\b')
+
 
 class Summarizer:
     """
@@ -17,27 +97,30 @@ class Summarizer:
         self,
         model: Optional[str] = None,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        force_llm: bool = False
     ):
         """
         Initialize summarizer with LLM configuration.
         
         Args:
-            model: OpenAI model name (defaults to config value)
+            model: OpenAI model name (defaults to the TOC model from config)
             temperature: Sampling temperature (defaults to config value)
             max_tokens: Maximum tokens for response (defaults to config value)
+            force_llm: Always ask the LLM, even when every title is already numbered
         """
-        self.model = model or config.llm_model
+        # Formatting titles is mechanical, so it can be routed to its own (smaller) model
+        self.model = model or config.toc_model
         self.temperature = temperature or config.temperature
         self.max_tokens = max_tokens or config.max_tokens
+        self.force_llm = force_llm
         
-        # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=self.model,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            openai_api_key=config.openai_api_key
-        )
+        # Identical prompts are answered from the response cache when configured
+        if config.llm_cache_path:
+            _install_llm_cache(config.llm_cache_path)
+        
+        # Initialize LLM (shared by summarizers with the same settings)
+        self.llm = _get_llm(self.model, self.temperature, self.max_tokens, config.openai_api_key)
     
     
     def summarize(self, chunks: List[Document], documents_data: List[Dict] = None) -> tuple[str, List[Dict]]:
@@ -50,114 +133,440 @@ class Summarizer:
             documents_data: List of document data with is_title information
             
         Returns:
-            Generated table of contents text
+            Tuple of the generated table of contents text and the titles data
+            (empty when the document has no section titles)
+            
+        Raises:
+            ValueError: If documents_data is empty
+        """
+        result = self.summarize_batch([documents_data])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    def summarize_batch(self, documents_data_list: List[List[Dict]]) -> List[Any]:
+        """
+        Generate tables of contents for several documents with one batched LLM call.
+        
+        Args:
+            documents_data_list: documents_data of each document, as for summarize
+            
+        Returns:
+            Per-document results in input order: what summarize would return,
+            or the exception it would raise
+        """
+        results = [None] * len(documents_data_list)
+        prompts = []
+        pending = []
+        for i, documents_data in enumerate(documents_data_list):
+            try:
+                title_entries, titles_data = self._extract_titles(documents_data)
+            except Exception as e:
+                results[i] = e
+                continue
+            
+            if not title_entries:
+                results[i] = (NO_TITLES_MESSAGE, [])
+                continue
+            
+            local_toc = self._local_toc(title_entries)
+            if local_toc is not None:
+                results[i] = (local_toc, titles_data)
+                continue
+            
+            prompts.append(self._build_prompt(title_entries))
+            pending.append((i, titles_data))
+        
+        if prompts:
+            # One failing request must not discard the other documents' results
+            responses = self.llm.batch(
+                prompts,
+                config={'max_concurrency': BATCH_MAX_CONCURRENCY},
+                return_exceptions=True
+            )
+            for (i, titles_data), response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    results[i] = Exception(f"Summarization failed: {str(response)}")
+                else:
+                    results[i] = (response.content.strip(), titles_data)
+        
+        return results
+    
+    def summarize_batch_offline(
+        self,
+        documents_data_by_id: Dict[str, List[Dict]],
+        poll_seconds: float = OFFLINE_BATCH_POLL_SECONDS,
+        timeout: Optional[float] = OFFLINE_BATCH_TIMEOUT_SECONDS
+    ) -> Dict[str, Any]:
+        """
+        Generate tables of contents through the OpenAI Batch API.
+        Jobs are billed at the discounted batch rate but may take up to 24 hours,
+        so this is meant for large offline runs.
+        
+        Args:
+            documents_data_by_id: documents_data of each document, keyed by a unique id
+            poll_seconds: Seconds to wait between job status checks
+            timeout: Seconds to wait for the job before cancelling it and
+                failing its documents, or None to wait until the job ends
+            
+        Returns:
+            Per-document results keyed by id, in input order: what summarize
+            would return, or the exception it would raise
+        """
+        results = {}
+        titles_by_id = {}
+        lines = []
+        for doc_id, documents_data in documents_data_by_id.items():
+            try:
+                title_entries, titles_data = self._extract_titles(documents_data)
+            except Exception as e:
+                results[doc_id] = e
+                continue
+            
+            if not title_entries:
+                results[doc_id] = (NO_TITLES_MESSAGE, [])
+                continue
+            
+            local_toc = self._local_toc(title_entries)
+            if local_toc is not None:
+                results[doc_id] = (local_toc, titles_data)
+                continue
+            
+            titles_by_id[doc_id] = titles_data
+            lines.append(json.dumps({
+                "custom_id": doc_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                    "messages": [{"role": "user", "content": self._build_prompt(title_entries)}]
+                }
+            }))
+        
+        if not lines:
+            return results
+        
+        client = OpenAI(api_key=config.openai_api_key)
+        try:
+            input_file = client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            while batch.status not in _OFFLINE_BATCH_DONE:
+                if deadline is not None and time.monotonic() >= deadline:
+                    client.batches.cancel(batch.id)
+                    raise TimeoutError(f"batch {batch.id} still {batch.status} after {timeout} seconds")
+                time.sleep(poll_seconds)
+                batch = client.batches.retrieve(batch.id)
+            
+            output = client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+        except Exception as e:
+            error = Exception(f"Summarization failed: {str(e)}")
+            results.update((doc_id, error) for doc_id in titles_by_id)
+            return {doc_id: results[doc_id] for doc_id in documents_data_by_id}
+        
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                doc_id = record.get('custom_id')
+                if doc_id not in titles_by_id:
+                    continue
+            except (ValueError, AttributeError, TypeError):
+                continue  # unattributable; its document is failed below
+            
+            try:
+                response = record.get('response') or {}
+                if response.get('status_code') == 200:
+                    summary = response['body']['choices'][0]['message']['content'] or ""
+                    results[doc_id] = (summary.strip(), titles_by_id[doc_id])
+                else:
+                    results[doc_id] = Exception(f"Summarization failed: {record.get('error') or response.get('body')}")
+            except (KeyError, IndexError, TypeError, AttributeError) as e:
+                results[doc_id] = Exception(f"Summarization failed: malformed batch output: {str(e)}")
+        
+        # Requests the job never answered (failed, expired or cancelled batches,
+        # or output lines that could not be parsed)
+        for doc_id in titles_by_id:
+            if doc_id not in results:
+                results[doc_id] = Exception(f"Summarization failed: batch {batch.id} ended as {batch.status}")
+        
+        return {doc_id: results[doc_id] for doc_id in documents_data_by_id}
+    
+    async def asummarize(self, chunks: List[Document], documents_data: List[Dict] = None) -> tuple[str, List[Dict]]:
+        """
+        Async variant of summarize, awaiting the LLM instead of blocking on it.
+        
+        Args:
+            chunks: List of Document chunks (not used anymore)
+            documents_data: List of document data with is_title information
+            
+        Returns:
+            Generated table of contents text and structured titles data
+            (empty when the document has no section titles), as for summarize
+            
+        Raises:
+            ValueError: If documents_data is empty
+        """
+        title_entries, titles_data = self._extract_titles(documents_data)
+        if not title_entries:
+            return NO_TITLES_MESSAGE, []
+        
+        local_toc = self._local_toc(title_entries)
+        if local_toc is not None:
+            return local_toc, titles_data
+        
+        try:
+            response = await self.llm.ainvoke(self._build_prompt(title_entries))
+        except Exception as e:
+            raise Exception(f"Summarization failed: {str(e)}")
+        
+        return response.content.strip(), titles_data
+    
+    async def asummarize_stream(self, chunks: List[Document], documents_data: List[Dict] = None) -> AsyncIterator[str]:
+        """
+        Stream the generated table of contents as the LLM produces it.
+        
+        Args:
+            chunks: List of Document chunks (not used anymore)
+            documents_data: List of document data with is_title information
+            
+        Yields:
+            Pieces of the table of contents text, in order
+            
+        Raises:
+            ValueError: If documents_data is empty
+        """
+        title_entries, _ = self._extract_titles(documents_data)
+        if not title_entries:
+            yield NO_TITLES_MESSAGE
+            return
+        
+        local_toc = self._local_toc(title_entries)
+        if local_toc is not None:
+            yield local_toc
+            return
+        
+        try:
+            async for chunk in self.llm.astream(self._build_prompt(title_entries)):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            raise Exception(f"Summarization failed: {str(e)}")
+    
+    async def asummarize_batch(self, documents_data_list: List[List[Dict]]) -> List[Any]:
+        """
+        Summarize several documents concurrently on the running event loop.
+        
+        Args:
+            documents_data_list: documents_data of each document, as for summarize
+            
+        Returns:
+            Per-document results in input order, as for summarize_batch
+        """
+        # Bound in-flight requests to stay within the API rate limits
+        semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+        
+        async def summarize_one(documents_data: List[Dict]):
+            async with semaphore:
+                return await self.asummarize([], documents_data)
+        
+        return await asyncio.gather(
+            *(summarize_one(documents_data) for documents_data in documents_data_list),
+            return_exceptions=True
+        )
+    
+    def _extract_titles(self, documents_data: List[Dict]) -> tuple[List[Tuple[str, Any]], List[Dict]]:
+        """
+        Collect the valid titles of a document, in order.
+        Person names that appear more than once are dropped.
+        
+        Args:
+            documents_data: List of document data with is_title information
+            
+        Returns:
+            Tuple of (title entries as (title, page label or None), structured titles data)
             
         Raises:
-            ValueError: If documents_data is empty or no titles found
+            ValueError: If documents_data is empty
         """
         if not documents_data:
             raise ValueError("Cannot summarize: documents_data is empty")
         
         # Extract titles directly from documents_data
-        titles = []
-        for doc in documents_data:
-            if doc.get('is_title', False):
-                text = doc.get('text', '').strip()
-                page = doc.get('page', '')
-                
-                if text:
-                    # Extract only the first line or first few lines for titles
-                    # Split by newlines and take the first non-empty line
-                    lines = [line.strip() for line in text.split('\n') if line.strip()]
-                    if lines:
-                        # Take the first line as the title
-                        title_text = lines[0]
-                        
-                        # If the first line is very short (like "2.1."), try to get the next line too
-                        if len(title_text) < 10 and len(lines) > 1:
-                            title_text = f"{title_text} {lines[1]}"
-                        
-                        # Filter out non-title content using both text patterns and font info
-                        font_info = doc.get('font_info', [])
-                        page_median_size = doc.get('page_median_size', None)
-                        if self._is_valid_title(title_text, font_info, page_median_size):
-                            if len(title_text) > 100:
-                                title_text = title_text[:100] + "..."
-                            
-                            # Add page number if available
-                            title_with_page = f"{title_text} (Page {page})" if page else title_text
-                            titles.append(title_with_page)
-        
-        if not titles:
-            return "No section titles found in the document."
+        title_entries = [
+            entry
+            for doc in documents_data
+            if doc.get('is_title', False) and (entry := self._extract_one_title(doc)) is not None
+        ]
+        
+        # Person names that recur (author headers and the like) are not sections
+        names = [_person_name(title) for title, _ in title_entries]
+        title_counts = Counter(name for name in names if name is not None)
+        title_entries = [
+            entry
+            for entry, name in zip(title_entries, names)
+            if name is None or title_counts[name] < 2
+        ]
         
         # Create structured titles data for JSON output
-        titles_data = []
-        for i, title in enumerate(titles):
-            # Extract page number from title if present
-            page_num = None
-            if " (Page " in title:
-                try:
-                    page_part = title.split(" (Page ")[1].rstrip(")")
-                except:
-                    page_part = None
-                if page_part and page_part.isdigit():
-                    page_num = int(page_part)
+        titles_data = [
+            {
+                "title": title,
+                "page": int(page) if page is not None and str(page).isdigit() else None,
+                "original_text": f"{title} (Page {page})" if page is not None else title
+            }
+            for title, page in title_entries
+        ]
+        
+        return title_entries, titles_data
+    
+    def _extract_one_title(self, doc: Dict) -> Optional[Tuple[str, Any]]:
+        """
+        Turn one title block into a (title, page label or None) entry.
+        
+        Args:
+            doc: Document data of a block flagged as a title
+            
+        Returns:
+            The entry, or None if the block holds no valid title
+        """
+        # Block text is stripped at ingestion; lines are stripped below
+        text = doc.get('text', '')
+        if not text:
+            return None
+        
+        # Extract only the first line or first few lines for titles:
+        # stop scanning once the first two non-empty lines are found
+        lines = (stripped for line in text.split('\n') if (stripped := line.strip()))
+        first_line = next(lines, None)
+        second_line = next(lines, None)
+        
+        if first_line is None:
+            return None
+        
+        # Take the first line as the title
+        title_text = first_line
+        
+        # If the first line is very short (like "2.1."), try to get the next line too
+        if len(title_text) < 10 and second_line is not None:
+            title_text = f"{title_text} {second_line}"
+        
+        # Filter out non-title content using both text patterns and font info
+        font_info = doc.get('font_info')
+        page_median_size = doc.get('page_median_size', None)
+        if not self._is_valid_title(title_text, font_info, page_median_size):
+            return None
+        
+        if len(title_text) > 100:
+            title_text = title_text[:100] + "..."
+        
+        # Keep the page alongside the title instead of parsing it back out later
+        return title_text, doc.get('page', '') or None
+    
+    def _local_toc(self, title_entries: List[Tuple[str, Any]]) -> Optional[str]:
+        """
+        Format the table of contents without the LLM when every title is numbered.
+        Reformatting numbered titles is mechanical, so the round-trip is skipped.
+        
+        Args:
+            title_entries: (title, page label or None) pairs, in document order
             
-            # Clean title text (remove page number)
-            clean_title = title.split(" (Page ")[0] if " (Page " in title else title
+        Returns:
+            Markdown table of contents nested by section depth, or None when
+            the LLM is needed (unnumbered, truncated or out-of-order titles,
+            or force_llm is set)
+        """
+        if self.force_llm:
+            return None
+        
+        lines = []
+        previous_number = ()
+        for title, page in title_entries:
+            # Truncated titles are body text the LLM should clean up
+            match = _NUM_PREFIX_RE.match(title)
+            if match is None or len(title) > 100:
+                return None
+            
+            # Numbering must run forward; restarts are enumerated lists, not sections
+            number = tuple(int(part) for part in match.group(1).split('.'))
+            if number <= previous_number:
+                return None
+            previous_number = number
             
-            titles_data.append({
-                "title": clean_title,
-                "page": page_num,
-                "original_text": title
-            })
+            indent = "  " * (len(number) - 1)
+            lines.append(f"{indent}- {title} (Page {page})" if page is not None else f"{indent}- {title}")
+        
+        return "\n".join(lines)
+    
+    def _build_prompt(self, title_entries: List[Tuple[str, Any]]) -> str:
+        """
+        Build the table-of-contents prompt for a list of titles.
         
+        Args:
+            title_entries: (title, page label or None) pairs, in document order
+            
+        Returns:
+            Prompt text for the LLM
+        """
         # Create prompt for table of contents
-        titles_text = "\n".join(f"- {title}" for title in titles)
-        prompt = f"""Please format the following section titles into a table of contents in markdown format, keeping the EXACT SAME ORDER as provided.
-
-Do NOT reorder or reorganize the sections. Just format them with proper numbering while maintaining the original sequence.
-
-Include page numbers where available.
-If a title appears to be a **person's name** (for example, "David M. Blei" or "John D. Lafferty") and it **appears multiple times**, ignore it completely — do NOT include it in the table of contents.
-
-Section titles (in order):
-{titles_text}
+        titles_text = "\n".join(
+            f"- {title} (Page {page})" if page is not None else f"- {title}"
+            for title, page in title_entries
+        )
+        return f"""{TOC_PROMPT_PREFIX}{titles_text}
 
 Table of Contents:"""
-        
-        try:
-            # Call LLM directly
-            response = self.llm.invoke(prompt)
-            summary = response.content.strip()
-            return summary, titles_data
-            
-        except Exception as e:
-            raise Exception(f"Summarization failed: {str(e)}")
     
     def format_output(
         self,
         summary: str,
         documents_data: List[Dict] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        titles_data: List[Dict] = None
+        titles_data: List[Dict] = None,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
-
-        # Calculate metadata from documents_data
-        total_pages = 0
+        """
+        Assemble the summary output with document statistics.
+        
+        Args:
+            summary: Generated table of contents text
+            documents_data: List of document data with is_title information
+            metadata: Extra metadata merged into the output metadata
+            titles_data: Structured titles data from summarize
+            timestamp: ISO timestamp to record (defaults to now)
+            
+        Returns:
+            Output dictionary for summary.json
+        """
+        # Calculate metadata from documents_data in a single pass
+        pages = set()
+        titles_found = 0
         if documents_data:
-            total_pages = len(set(doc.get('page', 0) for doc in documents_data))
+            for doc in documents_data:
+                pages.add(doc.get('page', 0))
+                if doc.get('is_title', False):
+                    titles_found += 1
+        total_pages = len(pages)
         
         output = {
             "ai_generated_toc": summary,
             "extracted_titles": titles_data or [],
             "metadata": {
                 "total_pages": total_pages,
-                "titles_found": len([d for d in documents_data or [] if d.get('is_title', False)]),
+                "titles_found": titles_found,
                 "model": self.model,
                 "temperature": self.temperature,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or datetime.now().isoformat()
             }
         }
         
@@ -167,7 +576,20 @@ Table of Contents:"""
         
         return output
     
-    def _is_valid_title(self, title: str, font_info: List[Dict] = None, page_median_size: float = None) -> bool:
+    def format_output_json(self, *args, **kwargs) -> bytes:
+        """
+        Serialize format_output's result as indented UTF-8 JSON.
+        
+        Args:
+            *args: Positional arguments of format_output
+            **kwargs: Keyword arguments of format_output
+            
+        Returns:
+            JSON bytes (encoded with orjson when installed)
+        """
+        return dumps_json(self.format_output(*args, **kwargs))
+    
+    def _is_valid_title(self, title: str, font_info: Dict = None, page_median_size: float = None) -> bool:
         """
         Check if text is a valid title (not author info, references, etc.).
         Uses both text patterns and font information for validation.
@@ -182,44 +604,10 @@ Table of Contents:"""
         """
         title = title.strip()
         
-        # Basic length checks
-        if len(title) < 3 or len(title) > 200:
-            return False
-        
-        # Special case: Standard section titles should always be valid
-        standard_sections = [
-            'Abstract', 'Introduction', 'Related Work', 'Background', 
-            'Methods', 'Materials and Methods', 'Experiments', 'Results', 
-            'Discussion', 'Conclusion', 'Conclusions', 'References', 
-            'Bibliography', 'Acknowledgments', 'Acknowledgements'
-        ]
-        
-        # Check both exact case and case-insensitive
-        if title in standard_sections or title.lower() in [s.lower() for s in standard_sections]:
-            return True
-        
-        # Filter out common non-title patterns (but keep it minimal)
-        non_title_patterns = [
-            r'^As in \[',  # "As in [19] and unlike [18]"
-        ]
-        
-        for pattern in non_title_patterns:
-            if re.match(pattern, title):
-                return False
-        
-        # Check for too many numbers (likely not a title)
-        if len(re.findall(r'\d+', title)) > 3:
-            return False
-        
-        # Check for too many special characters
-        if len(re.findall(r'[^\w\s\.\-\(\)]', title)) > 5:
-            return False
-        
-        # Check for very long sentences (likely not titles)
-        # But be more lenient with section numbers like "2.1. Title"
-        sentence_parts = title.split('.')
-        if len(sentence_parts) > 3:  # Allow up to 3 parts (like "2.1. Title")
-            return False
+        # Text rules are pure and memoised; None means the font check decides
+        verdict = _title_text_verdict(title)
+        if verdict is not None:
+            return verdict
         
         # Font-based validation (if font info is available)
         if font_info and page_median_size:
@@ -229,14 +617,14 @@ Table of Contents:"""
         
         return True
     
-    def _has_number_font_issues(self, title: str, font_info: List[Dict], page_median_size: float) -> bool:
+    def _has_number_font_issues(self, title: str, font_info: Dict, page_median_size: float) -> bool:
         """
         Check if numbers in the title have font issues that suggest it's not a real title.
         This is now much more lenient - only filters out very obvious non-titles.
         
         Args:
             title: Title text
-            font_info: Font information for the text
+            font_info: Font information for the text ('sizes', 'texts' arrays)
             page_median_size: Median font size for the page
             
         Returns:
@@ -245,22 +633,22 @@ Table of Contents:"""
         if not font_info or not page_median_size:
             return False
         
-        # Find numbers in the title
-        numbers = re.findall(r'\d+', title)
+        # Find numbers in the title. Spans are matched by substring, so a number
+        # containing another one ("12" holds "1") can never match on its own
+        numbers = set(_DIGITS_RE.findall(title))
         if not numbers:
             return False
+        numbers = [num for num in numbers if not any(other != num and other in num for other in numbers)]
         
         # Only filter out if numbers are VERY small (less than 70% of median)
         # This catches things like page numbers or footnotes that got mixed in
-        for span_info in font_info:
-            text = span_info.get('text', '')
-            size = span_info.get('size', 0)
-            
-            # If this span contains numbers
-            if any(num in text for num in numbers):
-                # Only filter if numbers are VERY small (likely footnotes/page numbers)
-                if size < page_median_size * 0.7:  # Much more lenient threshold
-                    return True
+        threshold = page_median_size * 0.7  # Much more lenient threshold
+        texts = font_info['texts']
+        small_spans = np.flatnonzero(font_info['sizes'] < threshold)
+        for i in small_spans:
+            # If this span contains numbers, they are VERY small (likely footnotes/page numbers)
+            if any(num in texts[i] for num in numbers):
+                return True
         
         return False
     
@@ -271,3 +659,125 @@ Table of Contents:"""
             f"temperature={self.temperature})"
         )
 
+
+def dumps_json(data) -> bytes:
+    """
+    Encode data as indented UTF-8 JSON, with orjson when installed.
+    Shared by format_output_json and the pipeline's output files.
+    
+    Args:
+        data: JSON-serializable object
+        
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=8)
+def _get_llm(model: str, temperature: float, max_tokens: int, api_key: str) -> ChatOpenAI:
+    """
+    Build the chat model for a configuration, once per process.
+    
+    Args:
+        model: OpenAI model name
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens for response
+        api_key: OpenAI API key
+        
+    Returns:
+        ChatOpenAI client, reused for identical settings
+    """
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        openai_api_key=api_key
+    )
+
+
+def _person_name(title: str) -> Optional[str]:
+    """
+    Recognise titles that are a person's name, e.g. author running headers.
+    
+    Args:
+        title: Title text
+        
+    Returns:
+        The normalized name (number prefix dropped, lowercased), or None if
+        the title does not look like a person's name
+    """
+    # Running headers carry a page number ("4 G. Audemard et al."). Numbered
+    # two-word sections ("2.4. Topic Modelling") fit the bare name shape too,
+    # so behind a number only initials or "et al." make it a name
+    name = title
+    match = _NUM_PREFIX_RE.match(title)
+    if match:
+        name = title[match.end():]
+        if not _NAME_MARKER_RE.search(name):
+            return None
+    
+    if not _PERSON_NAME_RE.match(name):
+        return None
+    
+    # Two-word section names such as "Related Work" also fit the name pattern
+    key = ' '.join(name.lower().split())
+    return None if key in _STANDARD_SECTIONS else key
+
+
+@lru_cache(maxsize=None)
+def _install_llm_cache(database_path: str) -> None:
+    """
+    Install a process-wide SQLite cache for LLM responses, once per path.
+    
+    Args:
+        database_path: Path of the SQLite database file
+        
+    Raises:
+        ImportError: If langchain-community is not installed
+    """
+    if SQLiteCache is None:
+        raise ImportError("LLM_CACHE_PATH requires langchain-community: pip install langchain-community")
+    set_llm_cache(SQLiteCache(database_path=database_path))
+
+
+@lru_cache(maxsize=4096)
+def _title_text_verdict(title: str) -> Optional[bool]:
+    """
+    Apply the text-only title validation rules.
+    
+    Args:
+        title: Stripped candidate title
+        
+    Returns:
+        True or False when the text decides, None when font analysis must decide
+    """
+    # Basic length checks
+    if len(title) < 3 or len(title) > 200:
+        return False
+    
+    # Special case: Standard section titles should always be valid
+    if title.lower() in _STANDARD_SECTIONS:
+        return True
+    
+    # Filter out common non-title patterns (but keep it minimal)
+    if _NON_TITLE_RE.match(title):
+        return False
+    
+    # Check for too many numbers (likely not a title)
+    if len(_DIGITS_RE.findall(title)) > 3:
+        return False
+    
+    # Check for too many special characters
+    if len(_SPECIAL_CHAR_RE.findall(title)) > 5:
+        return False
+    
+    # Check for very long sentences (likely not titles)
+    # But be more lenient with section numbers like "2.1. Title"
+    sentence_parts = title.split('.')
+    if len(sentence_parts) > 3:  # Allow up to 3 parts (like "2.1. Title")
+        return False
+    
+    return None
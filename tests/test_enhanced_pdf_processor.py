@@ -0,0 +1,63 @@
+"""Tests for opening files with the PDF processor."""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import fitz  # noqa: E402
+
+from enhanced_pdf_processor import EnhancedPDFProcessor, _classify_text  # noqa: E402
+
+
+class NonPdfInputTest(unittest.TestCase):
+    """Files with a .pdf name but other content are rejected."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.processor = EnhancedPDFProcessor()
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+    
+    def test_renamed_text_file(self):
+        path = self._write('notes.pdf', b"Introduction\nThis is a plain text file.\n")
+        with self.assertRaisesRegex(ValueError, "File is not a PDF"):
+            self.processor.load_pdf_with_structure(path)
+    
+    def test_renamed_image_file(self):
+        # MuPDF opens images by content even when told the stream is a PDF
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), 0)
+        path = self._write('scan.pdf', pixmap.tobytes('png'))
+        with self.assertRaisesRegex(ValueError, "File is not a PDF"):
+            self.processor.load_pdf_with_structure(path)
+    
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            self.processor.load_pdf_with_structure(os.path.join(self.tmp_dir, 'missing.pdf'))
+
+
+class PageNumberRuleTest(unittest.TestCase):
+    """Page numbers are recognised with str.isdigit(), as they always were."""
+    
+    def test_ascii_page_numbers(self):
+        for text in ['1234', '12-34', '3.14.15', '--12']:
+            self.assertIs(_classify_text(text), False, text)
+    
+    def test_non_ascii_digits(self):
+        # isdigit() accepts these although the regex class \d does not
+        for text in ['①②③④⑤⑥', '¹²³⁴⁵⁶', '²³-⁴⁵.⁶']:
+            self.assertTrue(text.replace('.', '').replace('-', '').isdigit())
+            self.assertIs(_classify_text(text), False, text)
+
+
+if __name__ == '__main__':
+    unittest.main()
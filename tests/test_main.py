@@ -0,0 +1,42 @@
+"""Tests for the summary cache of the pipeline."""
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from main import PDFSummarizationPipeline  # noqa: E402
+
+
+class SummaryCacheTest(unittest.TestCase):
+    """Cache entries round-trip, and damaged ones count as misses."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.pipeline = PDFSummarizationPipeline(input_dir=self.tmp.name, output_dir=self.tmp.name)
+        self.cache_path = Path(self.tmp.name) / ".cache" / "entry.json"
+    
+    def test_round_trip_leaves_no_temporary_files(self):
+        titles_data = [{'title': 'Introduction', 'page': 1, 'original_text': 'Introduction (Page 1)'}]
+        self.pipeline._store_cached_summary(self.cache_path, "1. Introduction", titles_data)
+        
+        self.assertEqual(self.pipeline._load_cached_summary(self.cache_path), ("1. Introduction", titles_data))
+        self.assertEqual(os.listdir(self.cache_path.parent), ['entry.json'])
+    
+    def test_missing_and_corrupt_entries_are_misses(self):
+        self.assertIsNone(self.pipeline._load_cached_summary(self.cache_path))
+        
+        self.cache_path.parent.mkdir()
+        for content in (b'{"summary": "1. Intro', b'{"summary": "1. Intro"}', b'[]'):
+            self.cache_path.write_bytes(content)
+            with self.assertLogs('pdf_sum', logging.WARNING):
+                self.assertIsNone(self.pipeline._load_cached_summary(self.cache_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
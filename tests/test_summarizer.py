@@ -0,0 +1,138 @@
+"""Tests for the title handling of the summarizer."""
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import summarizer as summarizer_module  # noqa: E402
+from summarizer import NO_TITLES_MESSAGE, Summarizer, _PERSON_NAME_RE  # noqa: E402
+
+
+# Running headers of data/input/2510.18628v1.pdf as the processor flags them
+SAMPLE_RUNNING_HEADERS = [
+    ('2 G. Audemard et al.', 2),
+    ('4 G. Audemard et al.', 4),
+    ('6 G. Audemard et al.', 6),
+    ('8 G. Audemard et al.', 8),
+]
+
+
+def _title_blocks(entries):
+    """Build title blocks as documents_data from (text, page) pairs."""
+    return [{'is_title': True, 'text': text, 'page': page} for text, page in entries]
+
+
+class PersonNameFilterTest(unittest.TestCase):
+    """Recurring person names must not reach the prompt."""
+    
+    def setUp(self):
+        self.summarizer = Summarizer()
+    
+    def test_sample_running_headers_are_dropped(self):
+        entries = [('1 Introduction', 1)] + SAMPLE_RUNNING_HEADERS + [('2.3 Association rules', 7)]
+        title_entries, titles_data = self.summarizer._extract_titles(_title_blocks(entries))
+        
+        self.assertEqual([title for title, _ in title_entries], ['1 Introduction', '2.3 Association rules'])
+        self.assertEqual([entry['title'] for entry in titles_data], ['1 Introduction', '2.3 Association rules'])
+        self.assertNotIn('Audemard', self.summarizer._build_prompt(title_entries))
+    
+    def test_name_shapes(self):
+        for name in ['G. Audemard et al.', 'David M. Blei', 'John D. Lafferty', 'J.-P. Sartre']:
+            self.assertTrue(_PERSON_NAME_RE.match(name), name)
+        for title in ['Association rules', 'Experimental Results Analysis', '2.1 Decision tree']:
+            self.assertFalse(_PERSON_NAME_RE.match(title), title)
+    
+    def test_single_name_and_recurring_sections_are_kept(self):
+        entries = [
+            ('David M. Blei', 1), ('2 Related Work', 2), ('5 Related Work', 5),
+            ('2.4. Topic Modelling', 3), ('4.2. Topic Modelling', 6)
+        ]
+        title_entries, _ = self.summarizer._extract_titles(_title_blocks(entries))
+        
+        self.assertEqual(title_entries, entries)
+
+
+class NoTitlesResultTest(unittest.TestCase):
+    """A document without titles gets the same (text, titles_data) shape on every path."""
+    
+    def setUp(self):
+        self.summarizer = Summarizer()
+        self.documents_data = [{'is_title': False, 'text': 'Body text only.', 'page': 1}]
+    
+    def test_sync_and_async_paths_agree(self):
+        expected = (NO_TITLES_MESSAGE, [])
+        
+        self.assertEqual(self.summarizer.summarize([], self.documents_data), expected)
+        self.assertEqual(self.summarizer.summarize_batch([self.documents_data]), [expected])
+        self.assertEqual(asyncio.run(self.summarizer.asummarize([], self.documents_data)), expected)
+        self.assertEqual(asyncio.run(self.summarizer.asummarize_batch([self.documents_data])), [expected])
+
+
+class _FakeBatchClient:
+    """Stand-in for the OpenAI client of summarize_batch_offline."""
+    
+    def __init__(self, statuses, output=""):
+        self._statuses = iter(statuses)
+        self._output = output
+        self.cancelled = []
+        self.files = SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id='file-in'),
+            content=lambda file_id: SimpleNamespace(text=self._output)
+        )
+        self.batches = SimpleNamespace(
+            create=lambda **kwargs: self._batch(),
+            retrieve=lambda batch_id: self._batch(),
+            cancel=self.cancelled.append
+        )
+    
+    def _batch(self):
+        status = next(self._statuses)
+        return SimpleNamespace(id='batch-1', status=status, output_file_id='file-out' if status == 'completed' else None)
+
+
+class OfflineBatchTest(unittest.TestCase):
+    """summarize_batch_offline turns job and output failures into per-document errors."""
+    
+    def setUp(self):
+        self.summarizer = Summarizer()
+        self.documents_data_by_id = {
+            'a': _title_blocks([('Introduction', 1), ('Methods', 2)]),
+            'b': _title_blocks([('Background', 1), ('Results', 3)]),
+            'empty': [{'is_title': False, 'text': 'Body text only.', 'page': 1}],
+        }
+    
+    def _run(self, client, **kwargs):
+        with mock.patch.object(summarizer_module, 'OpenAI', return_value=client):
+            return self.summarizer.summarize_batch_offline(self.documents_data_by_id, poll_seconds=0, **kwargs)
+    
+    def test_malformed_record_fails_only_its_document(self):
+        output = "\n".join([
+            '{"custom_id": "a", "response": {"status_code": 200, '
+            '"body": {"choices": [{"message": {"content": " TOC a "}}]}}}',
+            '{"custom_id": "b", "response": {"status_code": 200, "body": {"choices": []}}}',
+            'not json',
+        ])
+        results = self._run(_FakeBatchClient(['completed'], output))
+        
+        self.assertEqual(list(results), ['a', 'b', 'empty'])
+        self.assertEqual(results['a'][0], 'TOC a')
+        self.assertIsInstance(results['b'], Exception)
+        self.assertEqual(results['empty'], (NO_TITLES_MESSAGE, []))
+    
+    def test_timeout_cancels_the_job(self):
+        client = _FakeBatchClient(['in_progress'] * 3)
+        results = self._run(client, timeout=0)
+        
+        self.assertEqual(client.cancelled, ['batch-1'])
+        self.assertIsInstance(results['a'], Exception)
+        self.assertIn('after 0 seconds', str(results['b']))
+        self.assertEqual(results['empty'], (NO_TITLES_MESSAGE, []))
+
+
+if __name__ == '__main__':
+    unittest.main()